@@ -2,10 +2,18 @@ import google.generativeai as genai
 from dotenv import load_dotenv
 import os
 from complaint_db import ComplaintDatabase
+from info_extractor import extract_contact_info, HIGH_CONFIDENCE
 from datetime import datetime
 import smtplib
 from email.mime.text import MIMEText
-import re
+import uuid
+from turn_coalescer import TurnCoalescer
+from backup_scheduler import start_scheduled_backups, BACKUP_INTERVAL_SECONDS, BACKUP_KEEP
+
+
+class TurnError(Exception):
+    """A conversation turn failed; the message is the reply shown to the user"""
+
 
 class ComplaintResolutionChatbot:
     def __init__(self):
@@ -25,6 +33,18 @@ class ComplaintResolutionChatbot:
         self.complaint_state = 'idle'  # idle, awaiting_info, open, escalation_pending, resolved
         self.last_complaint_message = None
         self.clarification_turns = 0
+        self.session_id = str(uuid.uuid4())
+        self.turns = TurnCoalescer()
+        self.db.increment_counter('chat_sessions')
+        # Online snapshots of complaints.db, taken from inside the serving process
+        backup_dir = os.getenv('BACKUP_DIR')
+        if backup_dir:
+            start_scheduled_backups(
+                self.db,
+                backup_dir,
+                interval=int(os.getenv('BACKUP_INTERVAL_SECONDS', BACKUP_INTERVAL_SECONDS)),
+                keep=int(os.getenv('BACKUP_KEEP', BACKUP_KEEP))
+            )
 
     def format_timestamp(self, iso_timestamp):
         """Format ISO timestamp to Indian Standard Time"""
@@ -63,43 +83,20 @@ Complaint ID: {complaint_id}
             print(f"Failed to send email: {e}")
 
     def extract_user_info(self, user_input):
-        # Extract mobile number (10+ digits)
-        mobile_match = re.search(r'(\d{10,})', user_input)
-        if mobile_match:
-            self.user_info['mobile'] = mobile_match.group(1)
-        # Extract name
-        name_match = re.search(r'(?:my name is|name is|name)\s*([a-zA-Z ]+)', user_input, re.IGNORECASE)
-        if name_match:
-            self.user_info['name'] = name_match.group(1).strip().replace(',', '')
-        elif 'name' in user_input.lower() and not self.user_info['name']:
-            # Try to get name before 'number' or 'mobile'
-            parts = re.split(r'number|mobile', user_input, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                self.user_info['name'] = parts[0].replace('name', '').replace(':', '').strip().replace(',', '')
-        # Improved address extraction: capture everything after 'address:' or 'address is' or 'adderss' or at the end
-        address_match = re.search(r'(?:address is|adderss is|address:|adderss:|address|adderss)\s*([a-zA-Z0-9 ,\-/]+)', user_input, re.IGNORECASE)
-        if address_match:
-            self.user_info['address'] = address_match.group(1).strip()
-        elif 'address' in user_input.lower() or 'adderss' in user_input.lower():
-            # Try to get address after number
-            parts = re.split(r'number\s*\d{10,}', user_input, flags=re.IGNORECASE)
-            if len(parts) > 1:
-                self.user_info['address'] = parts[1].replace('address', '').replace('adderss', '').replace(':', '').strip().replace(',', '')
-        # Fallback: if message has 3 comma-separated values, guess order
-        if ',' in user_input and (not self.user_info['name'] or not self.user_info['mobile'] or not self.user_info['address']):
-            parts = [p.strip() for p in user_input.split(',')]
-            for part in parts:
-                if not self.user_info['name'] and part.lower().startswith('my name'):
-                    self.user_info['name'] = part.split()[-1]
-                elif not self.user_info['mobile'] and re.search(r'\d{10,}', part):
-                    self.user_info['mobile'] = re.search(r'\d{10,}', part).group(0)
-                elif not self.user_info['address'] and ('address' in part.lower() or 'adderss' in part.lower()):
-                    # Take everything after 'address' or 'adderss'
-                    addr = re.split(r'address|adderss', part, flags=re.IGNORECASE)[-1]
-                    self.user_info['address'] = addr.replace(':', '').strip()
-                elif not self.user_info['address'] and not self.user_info['mobile'] and not self.user_info['name']:
-                    # If only one left, treat as address
-                    self.user_info['address'] = part
+        """
+        Update the stored user info with any name, mobile or address in the message.
+
+        Explicit (high confidence) values replace earlier ones; positional
+        guesses only fill fields that are still missing.
+
+        Returns:
+            ExtractionResult: What was found in this message
+        """
+        info = extract_contact_info(user_input)
+        for field, extracted in info.fields():
+            if extracted.confidence >= HIGH_CONFIDENCE or not self.user_info[field]:
+                self.user_info[field] = extracted.value
+        return info
 
     def is_new_topic(self, new_msg, last_msg):
         if not last_msg:
@@ -113,20 +110,34 @@ Complaint ID: {complaint_id}
             return True
         return False
 
-    def get_response(self, user_input):
+    def get_response(self, user_input, turn_key=None):
         """
         Get a response from the chatbot for the given user input.
+
+        Calls with the same turn_key (double-clicks, retries of one form
+        submission) are coalesced per session, so the turn runs only once.
         
         Args:
             user_input (str): The user's complaint or message
+            turn_key (str): Idempotency key of this submission; a fresh
+                one is used when omitted
             
         Returns:
             str: The chatbot's response
         """
+        turn_key = turn_key or str(uuid.uuid4())
+        try:
+            reply, _ = self.turns.run(self.session_id, turn_key, lambda: self._respond(user_input))
+            return reply
+        except TurnError as e:
+            return str(e)
+
+    def _respond(self, user_input):
+        """Run one conversation turn; failures are raised as TurnError so they are not replayed"""
         try:
             self.chat_history.append({"role": "user", "content": user_input})
             # Always try to extract user info from the latest message
-            self.extract_user_info(user_input)
+            extracted_info = self.extract_user_info(user_input)
 
             # Improved topic change detection: only reset if the new message is truly unrelated
             if self.is_new_topic(user_input, self.last_complaint_message):
@@ -136,8 +147,7 @@ Complaint ID: {complaint_id}
                 self.user_info = {'name': None, 'mobile': None, 'address': None}
 
             # Only set the complaint message if it is not already set and the message is not just user info
-            info_keywords = ['name', 'mobile', 'number', 'address', 'adderss']
-            if self.last_complaint_message is None and not all(kw in user_input.lower() for kw in info_keywords):
+            if self.last_complaint_message is None and not extracted_info.is_complete:
                 self.last_complaint_message = user_input
                 self.clarification_turns = 0  # Reset on new complaint
 
@@ -490,7 +500,7 @@ If this is a legitimate complaint, tell the user you will register it and provid
         except Exception as e:
             error_message = f"An error occurred: {str(e)}"
             self.chat_history.append({"role": "bot", "content": error_message})
-            return error_message
+            raise TurnError(error_message) from e
 
     def get_chat_history(self):
         """
@@ -506,4 +516,5 @@ If this is a legitimate complaint, tell the user you will register it and provid
         Clear the chat history.
         """
         self.chat_history = []
-        self.current_complaint_id = None 
\ No newline at end of file
+        self.current_complaint_id = None
+        self.turns.forget(self.session_id)
\ No newline at end of file
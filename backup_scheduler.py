@@ -0,0 +1,83 @@
+import glob
+import os
+import re
+import threading
+from datetime import datetime
+
+BACKUP_INTERVAL_SECONDS = 3600
+BACKUP_KEEP = 24
+BACKUP_PREFIX = 'complaints-'
+# Only scheduler snapshots are subject to retention; manual backups with
+# other names in the same directory are left alone
+_SNAPSHOT_NAME = re.compile(rf'^{BACKUP_PREFIX}\d{{8}}-\d{{6}}\.db$')
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+class BackupScheduler:
+    """
+    Periodically snapshot the complaints database and keep the newest few.
+
+    Run it in the process that serves the chat. ComplaintDatabase.backup
+    then copies through the same connection the writers use, so concurrent
+    writes never restart the backup.
+    """
+
+    def __init__(self, db, directory, interval=BACKUP_INTERVAL_SECONDS, keep=BACKUP_KEEP):
+        self.db = db
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self._stop = threading.Event()
+        self._thread = None
+
+    def list_backups(self):
+        """Timestamped snapshots in this directory, oldest first"""
+        return sorted(
+            path for path in glob.glob(os.path.join(self.directory, f"{BACKUP_PREFIX}*.db"))
+            if _SNAPSHOT_NAME.match(os.path.basename(path))
+        )
+
+    def run_once(self):
+        """Take one snapshot and apply retention. Returns the snapshot path"""
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        path = self.db.backup(os.path.join(self.directory, f"{BACKUP_PREFIX}{stamp}.db"))
+        self.prune()
+        return path
+
+    def prune(self):
+        """Delete all but the newest `keep` snapshots"""
+        backups = self.list_backups()
+        for path in backups[:max(0, len(backups) - self.keep)]:
+            os.remove(path)
+
+    def run_forever(self):
+        """Take a snapshot every interval until stop() is called"""
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Scheduled backup failed: {e}")
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run_forever, name='complaint-backups', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def start_scheduled_backups(db, directory, interval=BACKUP_INTERVAL_SECONDS, keep=BACKUP_KEEP):
+    """Start the process-wide backup scheduler once; later calls return the running one"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = BackupScheduler(db, directory, interval, keep)
+            _scheduler.start()
+        return _scheduler
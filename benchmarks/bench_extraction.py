@@ -0,0 +1,94 @@
+"""
+Accuracy and throughput benchmark for info_extractor.extract_contact_info.
+
+extraction_corpus.jsonl is the tuning set the extractor's patterns and
+confidences were developed against, so its scores are optimistic.
+extraction_holdout.jsonl was labelled separately and must not be used to
+tune the extractor; its scores are the ones to quote. When a held-out miss
+is fixed, move the message into the tuning set and add fresh held-out ones.
+
+Run from the repository root:
+    python benchmarks/bench_extraction.py [--rounds N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from info_extractor import extract_contact_info, ExtractionResult, HIGH_CONFIDENCE
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_corpus.jsonl')
+HOLDOUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_holdout.jsonl')
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def measure_accuracy(corpus):
+    """
+    Return per-field accuracy, trusted precision and the list of mismatches.
+
+    Trusted precision is the share of values at or above HIGH_CONFIDENCE
+    that are correct; those are the values allowed to overwrite user info.
+    """
+    correct = dict.fromkeys(ExtractionResult.FIELDS, 0)
+    trusted = dict.fromkeys(ExtractionResult.FIELDS, 0)
+    trusted_correct = dict.fromkeys(ExtractionResult.FIELDS, 0)
+    mismatches = []
+    for sample in corpus:
+        result = extract_contact_info(sample['text'])
+        for field in ExtractionResult.FIELDS:
+            extracted = getattr(result, field)
+            value = extracted and extracted.value
+            if extracted is not None and extracted.confidence >= HIGH_CONFIDENCE:
+                trusted[field] += 1
+                trusted_correct[field] += value == sample[field]
+            if value == sample[field]:
+                correct[field] += 1
+            else:
+                mismatches.append((sample['text'], field, sample[field], extracted))
+    accuracy = {field: correct[field] / len(corpus) for field in correct}
+    precision = {field: trusted_correct[field] / trusted[field] if trusted[field] else None for field in trusted}
+    return accuracy, precision, mismatches
+
+
+def measure_throughput(corpus, rounds):
+    """Return mean microseconds per message over `rounds` passes of the corpus"""
+    texts = [sample['text'] for sample in corpus]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            extract_contact_info(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(texts)) * 1e6
+
+
+def report(label, corpus):
+    accuracy, precision, mismatches = measure_accuracy(corpus)
+    print(f"{label}: {len(corpus)} labelled messages")
+    for field, score in accuracy.items():
+        trusted = f"{precision[field]:.1%}" if precision[field] is not None else "n/a"
+        print(f"  {field:<8} accuracy: {score:.1%}  trusted precision: {trusted}")
+    for text, field, expected, found in mismatches:
+        print(f"  MISMATCH {field}: expected {expected!r}, got {found!r} in {text!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    holdout = load_corpus(HOLDOUT_PATH)
+    report("Tuning set", corpus)
+    report("Held-out set", holdout)
+    print(f"Throughput: {measure_throughput(corpus + holdout, args.rounds):.1f} us/message")
+
+
+if __name__ == '__main__':
+    main()
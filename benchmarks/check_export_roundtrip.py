@@ -0,0 +1,93 @@
+"""
+Export/import round-trip check for ComplaintDatabase.
+
+Writes a complaint with a long conversation to a scratch database, exports
+it in every available format, deletes it and imports it back, then checks
+that the complaint and its conversation come back unchanged. Exits non-zero
+on any difference.
+
+Run from the repository root:
+    python benchmarks/check_export_roundtrip.py [--messages N] [--message-size BYTES]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from complaint_db import ComplaintDatabase, EXPORT_FORMATS, _import_pyarrow
+
+
+def snapshot(db, complaint_id):
+    complaint = db.get_complaint(complaint_id)
+    return complaint, db.get_conversation_history(complaint_id)
+
+
+def delete_complaint(db, complaint_id):
+    with db._lock:
+        db.conn.execute('DELETE FROM complaint_conversations WHERE complaint_id = ?', (complaint_id,))
+        db.conn.execute('DELETE FROM complaints WHERE id = ?', (complaint_id,))
+        db.conn.commit()
+
+
+def available_formats():
+    formats = []
+    for fmt in EXPORT_FORMATS:
+        if fmt == 'parquet':
+            try:
+                _import_pyarrow()
+            except ImportError:
+                print("  parquet: skipped, pyarrow is not installed")
+                continue
+        formats.append(fmt)
+    return formats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=80)
+    parser.add_argument('--message-size', type=int, default=2048)
+    args = parser.parse_args()
+
+    failures = 0
+    repo_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        # ComplaintDatabase always opens complaints.db in the working directory
+        os.chdir(workdir)
+        db = ComplaintDatabase()
+        try:
+            complaint_id = db.add_complaint("Street light not working, Sector 4", "Thank you, noted.")
+            for i in range(args.messages):
+                role = 'bot' if i % 2 else 'user'
+                # Quotes, commas and newlines exercise CSV quoting inside the JSON cell
+                content = f'Reply {i}, "quoted",\nसड़क ' + 'x' * args.message_size
+                db.add_to_conversation(complaint_id, role, content)
+            expected = snapshot(db, complaint_id)
+
+            paths = {}
+            for fmt in available_formats():
+                paths[fmt] = os.path.join(workdir, f'roundtrip.{fmt}')
+                db.export_complaints(paths[fmt], fmt=fmt)
+
+            for fmt, path in paths.items():
+                delete_complaint(db, complaint_id)
+                try:
+                    imported = db.import_complaints(path, fmt=fmt)
+                    actual = snapshot(db, complaint_id)
+                except ValueError as e:
+                    imported, actual = 0, e
+                if imported == 1 and actual == expected:
+                    print(f"  {fmt}: ok ({os.path.getsize(path)} bytes, {len(expected[1])} messages)")
+                else:
+                    failures += 1
+                    print(f"  {fmt}: FAILED, imported {imported} complaints: {str(actual)[:200]}")
+        finally:
+            db.close()
+            os.chdir(repo_dir)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,154 @@ import sqlite3
 from datetime import datetime
 import uuid
 import threading
+import csv
+import json
+import os
+import re
+
+# Upper bound (hours) and label of each time-to-resolution histogram bucket
+RESOLUTION_BUCKETS = [
+    (1, '< 1 hour'),
+    (6, '1-6 hours'),
+    (24, '6-24 hours'),
+    (72, '1-3 days'),
+    (168, '3-7 days'),
+    (None, '> 7 days'),
+]
+
+
+def _resolution_bucket_sql(created, resolved):
+    """SQL expression mapping a created/resolved timestamp pair to its bucket index"""
+    hours = f"((julianday({resolved}) - julianday({created})) * 24)"
+    cases = ' '.join(
+        f"WHEN {hours} < {limit} THEN {index}"
+        for index, (limit, _) in enumerate(RESOLUTION_BUCKETS) if limit is not None
+    )
+    return f"CASE {cases} ELSE {len(RESOLUTION_BUCKETS) - 1} END"
+
+
+COMPLAINT_ID_PATTERN = re.compile(r'^COMP-\d{8}-[0-9a-f]{4}$')
+EXPORT_FIELDS = ['id', 'description', 'status', 'created_at', 'updated_at', 'resolution', 'changed_at', 'conversation']
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+EXPORT_BATCH_SIZE = 500
+# A conversation is exported as one JSON cell and easily outgrows the csv
+# module's default 128 KiB field limit. 2**31 - 1 is the largest limit
+# accepted on every platform (it is stored in a C long).
+CSV_FIELD_SIZE_LIMIT = 2**31 - 1
+# Online backups copy a few pages per step so writers wait at most one step
+BACKUP_PAGES_PER_STEP = 64
+BACKUP_STEP_SLEEP = 0.005
+
+
+def _detect_format(path, fmt):
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format {fmt!r}; use one of {', '.join(EXPORT_FORMATS)}")
+    return fmt
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet support requires pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _batched(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _flatten(record):
+    """Row for CSV / Parquet: nested conversation stored as a JSON string"""
+    row = dict(record)
+    if 'conversation' in row:
+        row['conversation'] = json.dumps(row['conversation'], ensure_ascii=False)
+    return row
+
+
+def _unflatten(row):
+    record = {k: (v if v != '' else None) for k, v in row.items()}
+    if record.get('conversation'):
+        record['conversation'] = json.loads(record['conversation'])
+    else:
+        record.pop('conversation', None)
+    return record
+
+
+def _write_records(path, fmt, records, batch_size):
+    if fmt == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    elif fmt == 'csv':
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for record in records:
+                writer.writerow(_flatten(record))
+    else:
+        pa = _import_pyarrow()
+        schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+        with pa.parquet.ParquetWriter(path, schema) as writer:
+            for batch in _batched(records, batch_size):
+                rows = [_flatten(record) for record in batch]
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+
+
+def _read_records(path, fmt, batch_size):
+    if fmt == 'jsonl':
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif fmt == 'csv':
+        csv.field_size_limit(max(csv.field_size_limit(), CSV_FIELD_SIZE_LIMIT))
+        with open(path, encoding='utf-8', newline='') as f:
+            reader = csv.DictReader(f)
+            try:
+                for row in reader:
+                    yield _unflatten(row)
+            except csv.Error as e:
+                raise ValueError(f"Malformed CSV at line {reader.line_num}: {e}") from e
+    else:
+        pa = _import_pyarrow()
+        for batch in pa.parquet.ParquetFile(path).iter_batches(batch_size=batch_size):
+            for row in batch.to_pylist():
+                yield _unflatten(row)
+
+
+def verify_backup(path):
+    """
+    Check that a backup file is a sound complaints database.
+
+    Returns:
+        list: Problems found; empty when the backup is usable
+    """
+    if not os.path.exists(path):
+        return [f"{path} does not exist"]
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            problems = [row[0] for row in conn.execute('PRAGMA integrity_check') if row[0] != 'ok']
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError as e:
+        return [str(e)]
+    for table in ('complaints', 'complaint_conversations'):
+        if table not in tables:
+            problems.append(f"missing table {table}")
+    return problems
+
 
 class ComplaintDatabase:
     _instance = None
@@ -34,7 +182,8 @@ class ComplaintDatabase:
                 status TEXT NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                resolution TEXT
+                resolution TEXT,
+                changed_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
@@ -49,7 +198,157 @@ class ComplaintDatabase:
                 FOREIGN KEY (complaint_id) REFERENCES complaints (id)
             )
         ''')
+        # changed_at tracks any change, including new conversation messages, for
+        # incremental export; updated_at stays the status time shown to users
+        cursor.execute('PRAGMA table_info(complaints)')
+        if 'changed_at' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE complaints ADD COLUMN changed_at DATETIME')
+            cursor.execute('UPDATE complaints SET changed_at = updated_at')
+        # Keyset pagination for incremental export, and per-complaint history lookups
+        cursor.execute('DROP INDEX IF EXISTS idx_complaints_updated_at')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_complaints_changed_at ON complaints (changed_at, id)')
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_conversations_complaint_id ON complaint_conversations (complaint_id, id)'
+        )
+        self.create_stats_tables(cursor)
         self.conn.commit()
+
+    def create_stats_tables(self, cursor):
+        """
+        Create the statistics rollups and the triggers that keep them current.
+
+        Every write to complaints updates the rollups in the same transaction,
+        so the operator dashboard never has to scan the complaints table.
+        Rollups added to an existing database are backfilled once.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'complaint_status_counts'")
+        needs_backfill = cursor.fetchone() is None
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS complaint_status_counts (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS complaint_daily_stats (
+                day TEXT PRIMARY KEY,
+                created INTEGER NOT NULL DEFAULT 0,
+                resolved INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS complaint_resolution_histogram (
+                bucket INTEGER PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS complaint_stats_counters (
+                name TEXT PRIMARY KEY,
+                value REAL NOT NULL DEFAULT 0
+            )
+        ''')
+
+        bucket = _resolution_bucket_sql('NEW.created_at', 'NEW.updated_at')
+        resolution_seconds = "(julianday(NEW.updated_at) - julianday(NEW.created_at)) * 86400"
+        record_resolution = f'''
+                INSERT INTO complaint_daily_stats (day, resolved) VALUES (date(NEW.updated_at), 1)
+                    ON CONFLICT(day) DO UPDATE SET resolved = resolved + 1;
+                INSERT INTO complaint_resolution_histogram (bucket, count) VALUES ({bucket}, 1)
+                    ON CONFLICT(bucket) DO UPDATE SET count = count + 1;
+                INSERT INTO complaint_stats_counters (name, value) VALUES ('resolved_total', 1)
+                    ON CONFLICT(name) DO UPDATE SET value = value + 1;
+                INSERT INTO complaint_stats_counters (name, value) VALUES ('resolution_seconds_total', {resolution_seconds})
+                    ON CONFLICT(name) DO UPDATE SET value = value + excluded.value;
+        '''
+        # Recreate the triggers so databases created by older versions pick up changes
+        for trigger in ('complaints_stats_insert', 'complaints_stats_insert_resolved', 'complaints_stats_status',
+                        'complaints_stats_resolved', 'complaints_stats_delete'):
+            cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS complaints_stats_insert AFTER INSERT ON complaints
+            BEGIN
+                INSERT INTO complaint_status_counts (status, count) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+                INSERT INTO complaint_daily_stats (day, created) VALUES (date(NEW.created_at), 1)
+                    ON CONFLICT(day) DO UPDATE SET created = created + 1;
+                INSERT INTO complaint_stats_counters (name, value) VALUES ('complaints_total', 1)
+                    ON CONFLICT(name) DO UPDATE SET value = value + 1;
+            END
+        ''')
+        # Rows written as already resolved, e.g. by import_complaints
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS complaints_stats_insert_resolved AFTER INSERT ON complaints
+            WHEN NEW.status = 'Resolved'
+            BEGIN
+                {record_resolution}
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS complaints_stats_status AFTER UPDATE OF status ON complaints
+            WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                UPDATE complaint_status_counts SET count = count - 1 WHERE status = OLD.status;
+                INSERT INTO complaint_status_counts (status, count) VALUES (NEW.status, 1)
+                    ON CONFLICT(status) DO UPDATE SET count = count + 1;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS complaints_stats_resolved AFTER UPDATE OF status ON complaints
+            WHEN NEW.status = 'Resolved' AND OLD.status IS NOT 'Resolved'
+            BEGIN
+                {record_resolution}
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS complaints_stats_delete AFTER DELETE ON complaints
+            BEGIN
+                UPDATE complaint_status_counts SET count = count - 1 WHERE status = OLD.status;
+                UPDATE complaint_daily_stats SET created = created - 1 WHERE day = date(OLD.created_at);
+                UPDATE complaint_stats_counters SET value = value - 1 WHERE name = 'complaints_total';
+            END
+        ''')
+
+        if needs_backfill:
+            self.backfill_stats(cursor)
+
+    def backfill_stats(self, cursor):
+        """Rebuild the statistics rollups from the complaints table (one full scan)"""
+        old_bucket = _resolution_bucket_sql('created_at', 'updated_at')
+        for table in ('complaint_status_counts', 'complaint_daily_stats', 'complaint_resolution_histogram'):
+            cursor.execute(f'DELETE FROM {table}')
+        cursor.execute(
+            "DELETE FROM complaint_stats_counters WHERE name IN ('complaints_total', 'resolved_total', 'resolution_seconds_total')"
+        )
+        cursor.execute('''
+            INSERT INTO complaint_status_counts (status, count)
+            SELECT status, COUNT(*) FROM complaints GROUP BY status
+        ''')
+        cursor.execute('''
+            INSERT INTO complaint_daily_stats (day, created)
+            SELECT date(created_at), COUNT(*) FROM complaints GROUP BY date(created_at)
+        ''')
+        # Resolution time of already-resolved complaints is approximated by their last update
+        cursor.execute('''
+            INSERT INTO complaint_daily_stats (day, resolved)
+            SELECT date(updated_at), COUNT(*) FROM complaints WHERE status = 'Resolved' GROUP BY date(updated_at)
+            ON CONFLICT(day) DO UPDATE SET resolved = excluded.resolved
+        ''')
+        cursor.execute(f'''
+            INSERT INTO complaint_resolution_histogram (bucket, count)
+            SELECT {old_bucket}, COUNT(*) FROM complaints WHERE status = 'Resolved' GROUP BY 1
+        ''')
+        cursor.execute('''
+            INSERT INTO complaint_stats_counters (name, value)
+            SELECT 'complaints_total', COUNT(*) FROM complaints
+            UNION ALL
+            SELECT 'resolved_total', COUNT(*) FROM complaints WHERE status = 'Resolved'
+            UNION ALL
+            SELECT 'resolution_seconds_total',
+                   COALESCE(SUM((julianday(updated_at) - julianday(created_at)) * 86400), 0)
+            FROM complaints WHERE status = 'Resolved'
+        ''')
     
     def generate_complaint_id(self):
         """Generate a unique complaint ID"""
@@ -65,7 +364,7 @@ class ComplaintDatabase:
             
             # Add complaint
             cursor.execute(
-                'INSERT INTO complaints (id, description, status) VALUES (?, ?, ?)',
+                'INSERT INTO complaints (id, description, status, changed_at) VALUES (?, ?, ?, CURRENT_TIMESTAMP)',
                 (complaint_id, description, "Open")
             )
             
@@ -78,6 +377,12 @@ class ComplaintDatabase:
                 'INSERT INTO complaint_conversations (complaint_id, role, content) VALUES (?, ?, ?)',
                 (complaint_id, "bot", initial_response)
             )
+
+            # Only complaints registered by the chatbot are escalations, not imported rows
+            cursor.execute(
+                "INSERT INTO complaint_stats_counters (name, value) VALUES ('escalations', 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+            )
             
             self.conn.commit()
             return complaint_id
@@ -105,12 +410,12 @@ class ComplaintDatabase:
             cursor = self.conn.cursor()
             if resolution:
                 cursor.execute(
-                    'UPDATE complaints SET status = ?, resolution = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                    'UPDATE complaints SET status = ?, resolution = ?, updated_at = CURRENT_TIMESTAMP, changed_at = CURRENT_TIMESTAMP WHERE id = ?',
                     (status, resolution, complaint_id)
                 )
             else:
                 cursor.execute(
-                    'UPDATE complaints SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+                    'UPDATE complaints SET status = ?, updated_at = CURRENT_TIMESTAMP, changed_at = CURRENT_TIMESTAMP WHERE id = ?',
                     (status, complaint_id)
                 )
             self.conn.commit()
@@ -123,6 +428,11 @@ class ComplaintDatabase:
                 'INSERT INTO complaint_conversations (complaint_id, role, content) VALUES (?, ?, ?)',
                 (complaint_id, role, content)
             )
+            # New messages count as a change for incremental exports
+            cursor.execute(
+                'UPDATE complaints SET changed_at = CURRENT_TIMESTAMP WHERE id = ?',
+                (complaint_id,)
+            )
             self.conn.commit()
     
     def get_conversation_history(self, complaint_id):
@@ -142,6 +452,278 @@ class ComplaintDatabase:
             cursor.execute('SELECT * FROM complaints ORDER BY created_at DESC')
             return cursor.fetchall()
     
+    def iter_complaint_records(self, since=None, batch_size=EXPORT_BATCH_SIZE, include_conversations=True):
+        """
+        Stream complaints as dicts in (changed_at, id) order.
+
+        Rows are read in keyset-paginated batches and the lock is held only
+        while a batch is fetched, so chat writes interleave with long exports.
+
+        Args:
+            since (str): Only complaints with changed_at >= since (watermark)
+            batch_size (int): Complaints fetched per batch
+            include_conversations (bool): Attach each complaint's messages
+
+        Yields:
+            dict: Complaint fields, plus 'conversation' if requested
+        """
+        last_key = (since or '', '')
+        while True:
+            with self._lock:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    'SELECT id, description, status, created_at, updated_at, resolution, changed_at FROM complaints '
+                    'WHERE changed_at >= ? AND (changed_at, id) > (?, ?) ORDER BY changed_at, id LIMIT ?',
+                    (since or '', last_key[0], last_key[1], batch_size)
+                )
+                rows = cursor.fetchall()
+                conversations = {}
+                if rows and include_conversations:
+                    placeholders = ', '.join('?' * len(rows))
+                    cursor.execute(
+                        'SELECT complaint_id, timestamp, role, content FROM complaint_conversations '
+                        f'WHERE complaint_id IN ({placeholders}) ORDER BY complaint_id, id',
+                        [row[0] for row in rows]
+                    )
+                    for complaint_id, timestamp, role, content in cursor.fetchall():
+                        conversations.setdefault(complaint_id, []).append(
+                            {'timestamp': timestamp, 'role': role, 'content': content}
+                        )
+            if not rows:
+                return
+            for row in rows:
+                record = dict(zip(EXPORT_FIELDS, row))
+                if include_conversations:
+                    record['conversation'] = conversations.get(row[0], [])
+                yield record
+            last_key = (rows[-1][6], rows[-1][0])
+
+    def export_complaints(self, path, fmt=None, since=None, batch_size=EXPORT_BATCH_SIZE, include_conversations=True):
+        """
+        Export complaints (and their conversations) to JSONL, CSV or Parquet.
+
+        Memory use is bounded by batch_size. The file is written under a
+        temporary name and renamed, so readers never see a partial export.
+        Complaints changed exactly at the watermark second are exported
+        again on the next run; import_complaints upserts, so that is harmless.
+
+        Args:
+            path (str): Output file; the format defaults to its extension
+            fmt (str): 'jsonl', 'csv' or 'parquet' (Parquet needs pyarrow)
+            since (str): Incremental export watermark (a changed_at value)
+
+        Returns:
+            dict: {'count': complaints written, 'watermark': latest changed_at
+                  exported, to pass as `since` next time}
+        """
+        fmt = _detect_format(path, fmt)
+        stats = {'count': 0, 'watermark': since}
+
+        def tracked(records):
+            for record in records:
+                stats['count'] += 1
+                stats['watermark'] = record['changed_at']
+                yield record
+
+        records = tracked(self.iter_complaint_records(since, batch_size, include_conversations))
+        tmp_path = f"{path}.tmp"
+        try:
+            _write_records(tmp_path, fmt, records, batch_size)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return stats
+
+    def import_complaints(self, path, fmt=None, batch_size=EXPORT_BATCH_SIZE):
+        """
+        Import complaints from a file written by export_complaints.
+
+        Complaints are upserted by ID in batches with executemany. The lock is
+        held per batch, not for the whole file. A record that carries a
+        conversation replaces that complaint's stored conversation.
+
+        Raises:
+            ValueError: On a record with a malformed complaint ID, missing
+                fields or a malformed conversation, or on unreadable CSV;
+                batches before it stay imported
+
+        Returns:
+            int: Number of complaints imported
+        """
+        fmt = _detect_format(path, fmt)
+        count = 0
+        for batch in _batched(_read_records(path, fmt, batch_size), batch_size):
+            for offset, record in enumerate(batch):
+                complaint_id = record.get('id')
+                if not isinstance(complaint_id, str) or not COMPLAINT_ID_PATTERN.match(complaint_id):
+                    raise ValueError(f"Invalid complaint ID {complaint_id!r} in record {count + offset + 1}")
+                if not record.get('description') or not record.get('status'):
+                    raise ValueError(f"Complaint {complaint_id} in record {count + offset + 1} needs a description and status")
+                conversation = record.get('conversation', [])
+                if not isinstance(conversation, list) or not all(
+                    isinstance(message, dict) and message.get('role') and isinstance(message.get('content'), str)
+                    for message in conversation
+                ):
+                    raise ValueError(
+                        f"Complaint {complaint_id} in record {count + offset + 1} has a malformed conversation; "
+                        "expected a list of objects with 'role' and 'content'"
+                    )
+
+            now = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+            complaints = [
+                (r['id'], r['description'], r['status'], r.get('created_at') or now,
+                 r.get('updated_at') or now, r.get('resolution'))
+                for r in batch
+            ]
+            with_conversation = [r for r in batch if 'conversation' in r]
+            messages = [
+                (r['id'], m.get('timestamp') or now, m['role'], m['content'])
+                for r in with_conversation for m in r['conversation']
+            ]
+            with self._lock:
+                cursor = self.conn.cursor()
+                try:
+                    cursor.executemany(
+                        'INSERT INTO complaints (id, description, status, created_at, updated_at, resolution, changed_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP) ON CONFLICT(id) DO UPDATE SET '
+                        'description = excluded.description, status = excluded.status, '
+                        'created_at = excluded.created_at, updated_at = excluded.updated_at, '
+                        'resolution = excluded.resolution, changed_at = excluded.changed_at',
+                        complaints
+                    )
+                    cursor.executemany(
+                        'DELETE FROM complaint_conversations WHERE complaint_id = ?',
+                        [(r['id'],) for r in with_conversation]
+                    )
+                    cursor.executemany(
+                        'INSERT INTO complaint_conversations (complaint_id, timestamp, role, content) VALUES (?, ?, ?, ?)',
+                        messages
+                    )
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            count += len(batch)
+        return count
+
+    def backup(self, dest_path, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP):
+        """
+        Take a consistent online backup of the database.
+
+        Uses SQLite's incremental backup API on the app's own connection and
+        does not take the lock, so add_complaint / add_to_conversation run
+        between steps. Their changes reach the copy without restarting it.
+        The copy is integrity-checked before it replaces dest_path.
+
+        Raises:
+            sqlite3.DatabaseError: If the finished copy fails verification
+
+        Returns:
+            str: dest_path
+        """
+        tmp_path = f"{dest_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            target = sqlite3.connect(tmp_path)
+            try:
+                self.conn.backup(target, pages=pages, sleep=sleep)
+            finally:
+                target.close()
+            problems = verify_backup(tmp_path)
+            if problems:
+                raise sqlite3.DatabaseError(f"Backup verification failed: {'; '.join(problems)}")
+            os.replace(tmp_path, dest_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return dest_path
+
+    def restore(self, src_path):
+        """
+        Replace the database contents with a verified backup.
+
+        Unlike backup, this holds the lock throughout so no write can
+        interleave with the restore.
+
+        Raises:
+            ValueError: If the backup fails verification
+        """
+        problems = verify_backup(src_path)
+        if problems:
+            raise ValueError(f"Refusing to restore {src_path}: {'; '.join(problems)}")
+        source = sqlite3.connect(f"file:{src_path}?mode=ro", uri=True)
+        try:
+            with self._lock:
+                self.conn.commit()
+                source.backup(self.conn)
+                # Backups from older versions may predate the rollups and indexes
+                self.create_tables()
+        finally:
+            source.close()
+
+    def increment_counter(self, name, amount=1):
+        """Add to a named statistics counter, e.g. 'chat_sessions'"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                'INSERT INTO complaint_stats_counters (name, value) VALUES (?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value',
+                (name, amount)
+            )
+            self.conn.commit()
+
+    def get_status_counts(self):
+        """Get the number of complaints per status"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT status, count FROM complaint_status_counts WHERE count > 0 ORDER BY status')
+            return dict(cursor.fetchall())
+
+    def get_daily_stats(self, days=30):
+        """Get (day, created, resolved) rows for the most recent days, oldest first"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                'SELECT day, created, resolved FROM complaint_daily_stats ORDER BY day DESC LIMIT ?',
+                (days,)
+            )
+            return cursor.fetchall()[::-1]
+
+    def get_resolution_histogram(self):
+        """Get (bucket label, count) pairs for time-to-resolution"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT bucket, count FROM complaint_resolution_histogram')
+            counts = dict(cursor.fetchall())
+        return [(label, counts.get(index, 0)) for index, (_, label) in enumerate(RESOLUTION_BUCKETS)]
+
+    def get_stats_summary(self):
+        """Get headline statistics: totals, backlog, mean resolution time and escalations per session"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('SELECT name, value FROM complaint_stats_counters')
+            counters = dict(cursor.fetchall())
+            cursor.execute("SELECT COALESCE(SUM(count), 0) FROM complaint_status_counts WHERE status != 'Resolved'")
+            backlog = cursor.fetchone()[0]
+        total = int(counters.get('complaints_total', 0))
+        resolved = int(counters.get('resolved_total', 0))
+        escalations = int(counters.get('escalations', 0))
+        sessions = int(counters.get('chat_sessions', 0))
+        return {
+            'total': total,
+            'backlog': backlog,
+            'resolved': resolved,
+            'avg_resolution_hours': counters.get('resolution_seconds_total', 0) / resolved / 3600 if resolved else None,
+            'chat_sessions': sessions,
+            'escalations': escalations,
+            # Complaints the chatbot registered per chat session; a ratio, not a share,
+            # since one session can escalate several complaints. Both counters start
+            # when the rollups are created, so history is excluded
+            'escalations_per_session': escalations / sessions if sessions else None,
+        }
+
     def close(self):
         """Close the database connection"""
         with self._lock:
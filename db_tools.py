@@ -0,0 +1,118 @@
+"""
+Maintenance commands for complaints.db.
+
+    python db_tools.py export complaints.jsonl [--since "2025-06-09 00:00:00"]
+    python db_tools.py import complaints.jsonl
+    python db_tools.py backup [backups/manual-before-migration.db]
+    python db_tools.py verify backups/complaints-20250610-070000.db
+    python db_tools.py restore backups/complaints-20250610-070000.db
+    python db_tools.py backup-schedule --dir backups --interval 3600 --keep 24
+"""
+import argparse
+import sys
+from complaint_db import ComplaintDatabase, EXPORT_BATCH_SIZE, EXPORT_FORMATS, verify_backup
+from backup_scheduler import BackupScheduler, BACKUP_INTERVAL_SECONDS, BACKUP_KEEP
+
+
+def export_command(db, args):
+    result = db.export_complaints(
+        args.path,
+        fmt=args.format,
+        since=args.since,
+        batch_size=args.batch_size,
+        include_conversations=not args.no_conversations
+    )
+    print(f"Exported {result['count']} complaints to {args.path}")
+    print(f"Next watermark: {result['watermark']}")
+
+
+def import_command(db, args):
+    count = db.import_complaints(args.path, fmt=args.format, batch_size=args.batch_size)
+    print(f"Imported {count} complaints from {args.path}")
+
+
+def backup_command(db, args):
+    if args.path:
+        path = db.backup(args.path)
+    else:
+        path = BackupScheduler(db, args.dir, keep=sys.maxsize).run_once()
+    print(f"Backup written and verified: {path}")
+
+
+def verify_command(db, args):
+    problems = verify_backup(args.path)
+    if problems:
+        print(f"{args.path} is NOT usable:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"{args.path} passed integrity check")
+
+
+def restore_command(db, args):
+    db.restore(args.path)
+    print(f"Restored complaints.db from {args.path}")
+
+
+def backup_schedule_command(db, args):
+    # A separate process backs up through its own connection. Under heavy write
+    # load, prefer BACKUP_DIR in the app, which backs up from inside the serving process.
+    scheduler = BackupScheduler(db, args.dir, interval=args.interval, keep=args.keep)
+    print(f"Backing up every {args.interval}s to {args.dir}, keeping {args.keep}; Ctrl-C to stop")
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Maintenance commands for complaints.db")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser('export', help="Stream complaints and conversations to a file")
+    export_parser.add_argument('path')
+    export_parser.add_argument('--format', choices=EXPORT_FORMATS, help="Defaults to the file extension")
+    export_parser.add_argument('--since', help="Only complaints changed at or after this watermark")
+    export_parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE)
+    export_parser.add_argument('--no-conversations', action='store_true')
+    export_parser.set_defaults(handler=export_command)
+
+    import_parser = commands.add_parser('import', help="Upsert complaints and conversations from a file")
+    import_parser.add_argument('path')
+    import_parser.add_argument('--format', choices=EXPORT_FORMATS, help="Defaults to the file extension")
+    import_parser.add_argument('--batch-size', type=int, default=EXPORT_BATCH_SIZE)
+    import_parser.set_defaults(handler=import_command)
+
+    backup_parser = commands.add_parser('backup', help="Take a verified online backup")
+    backup_parser.add_argument('path', nargs='?', help="Defaults to a timestamped file in --dir")
+    backup_parser.add_argument('--dir', default='backups')
+    backup_parser.set_defaults(handler=backup_command)
+
+    verify_parser = commands.add_parser('verify', help="Integrity-check a backup file")
+    verify_parser.add_argument('path')
+    verify_parser.set_defaults(handler=verify_command)
+
+    restore_parser = commands.add_parser('restore', help="Replace complaints.db with a verified backup")
+    restore_parser.add_argument('path')
+    restore_parser.set_defaults(handler=restore_command)
+
+    schedule_parser = commands.add_parser('backup-schedule', help="Take backups periodically with retention")
+    schedule_parser.add_argument('--dir', default='backups')
+    schedule_parser.add_argument('--interval', type=int, default=BACKUP_INTERVAL_SECONDS)
+    schedule_parser.add_argument('--keep', type=int, default=BACKUP_KEEP)
+    schedule_parser.set_defaults(handler=backup_schedule_command)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    db = ComplaintDatabase()
+    try:
+        args.handler(db, args)
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
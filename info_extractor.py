@@ -0,0 +1,253 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Fields below this confidence only fill gaps, they never overwrite a value
+# the user already gave explicitly.
+HIGH_CONFIDENCE = 0.8
+
+# Latin and Devanagari letters (danda and Devanagari digits excluded)
+_LETTERS = 'A-Za-z\u0900-\u0963\u0971-\u097F'
+_START = f'(?<![{_LETTERS}])'
+_END = f'(?![{_LETTERS}])'
+_POSSESSIVE = r'(?:my|mera|meri|mere|hamara|hamari|मेरा|मेरी|मेरे|हमारा|हमारी)\s+'
+
+_NAME_KEYWORD = (
+    f'{_START}(?P<name_owner>{_POSSESSIVE})?(?:full\\s+)?(?:name|naam|नाम){_END}'
+)
+# A bare "number" / "no" is usually a consumer, meter or account number;
+# only "my number" counts as a mobile keyword on its own.
+_MOBILE_KEYWORD = (
+    f'{_START}(?:'
+    f'(?:{_POSSESSIVE})?'
+    r'(?:mobile|phone|contact|cell|whatsapp|मोबाइल|फ़ोन|फोन)'
+    r'(?:\s+(?:number|num|no\.?|नंबर|नम्बर))?'
+    f'|{_POSSESSIVE}(?:number|num|no\\.?|नंबर|नम्बर)'
+    f'){_END}'
+)
+# "pata" / "पता" also means "know", so it only counts as the address keyword
+# after a possessive ("mera pata") or right before a colon ("pata: ...").
+_ADDRESS_KEYWORD = (
+    f'{_START}(?:'
+    f'(?P<address_owner>{_POSSESSIVE})?(?:home\\s+|postal\\s+|residential\\s+)?'
+    r'(?:address|adderss|addres|adress|addrss|addr)'
+    f'|{_POSSESSIVE}(?:pata|पता)'
+    r'|(?:pata|पता)(?=\s*[:\-])'
+    f'){_END}'
+)
+# Indian mobile: optional +91 / 0091 / 91 / 0 prefix, then 10 digits starting 6-9
+_MOBILE_NUMBER = (
+    r'(?<![\d+])(?:(?:\+|00)?91[\s-]?|0)?'
+    r'(?P<digits>[6-9]\d{4}[\s-]?\d{5})(?!\d)'
+)
+
+_SCANNER = re.compile(
+    f'(?P<name>{_NAME_KEYWORD})'
+    f'|(?P<mobile_kw>{_MOBILE_KEYWORD})'
+    f'|(?P<address>{_ADDRESS_KEYWORD})'
+    f'|(?P<number>{_MOBILE_NUMBER})',
+    re.IGNORECASE,
+)
+_NAME_WORD = re.compile(f"[{_LETTERS}][{_LETTERS}'.]*")
+# Between a mobile keyword and the number: "mobile number is: 98..."
+_KEY_GAP = re.compile(r'(?:\s|[:=\-]|is|hai|है|on)*', re.IGNORECASE)
+# "consumer number 98...", "meter no: 91..." identify something other than a phone
+_REFERENCE_CUE = re.compile(
+    r'(?<![A-Za-z\u0900-\u097F])(?:consumer|customer|account|acct?|meter|bill|connection|ca'
+    r'|order|complaint|ticket|service|registration|reference|ref|policy|aadhaa?r|id|invoice'
+    r'|transaction|tracking|vehicle|house|flat|plot|khata|बिल|मीटर|खाता|उपभोक्ता)'
+    r'\s*(?:number|num|no\.?|id|नंबर|नम्बर)?\s*(?:is|hai|है)?\s*[:\-#]?\s*$',
+    re.IGNORECASE
+)
+# Copula or colon right after a keyword: "name is", "naam hai", "address:"
+_COPULA = re.compile(r'\s*(?:[:=\-]|(?:is|hai|है)(?![A-Za-z\u0900-\u097F]))', re.IGNORECASE)
+# A keyword opens a clause when it follows punctuation, a conjunction or nothing
+_CLAUSE_BREAK = re.compile(
+    r'(?:^|[,.;:!?।\n]|(?<![A-Za-z\u0900-\u097F])(?:and|aur|और|&))\s*$', re.IGNORECASE
+)
+_SENTENCE_END = re.compile(r'[।?!\n]|(?<=[a-z]{3})\.\s+(?=[A-Z])')
+_DEVANAGARI_DIGITS = str.maketrans('०१२३४५६७८९', '0123456789')
+
+_PUNCT = ' ,.;:-=।'
+_KEYED_MOBILE_CONFIDENCE = 0.99
+_BARE_MOBILE_CONFIDENCE = 0.7
+_FORM_FIELD_CONFIDENCE = 0.6
+_POSITIONAL_NAME_CONFIDENCE = 0.6
+_POSITIONAL_ADDRESS_CONFIDENCE = 0.5
+_MAX_NAME_WORDS = 4
+_MIN_ADDRESS_LENGTH = 3
+_LEADING_FILLER = frozenset({'is', 'was', 'hai', 'है', 'ka', 'का', 'ki', 'की'})
+_TRAILING_FILLER = frozenset({
+    'is', 'and', 'my', 'hai', 'h', 'hoon', 'hu', 'aur', 'और', 'है', 'हूँ', 'हूं',
+    'mera', 'meri', 'mere', 'मेरा', 'मेरी', 'मेरे', 'number', 'no', 'num',
+    'नंबर', 'नम्बर', 'ka', 'का', 'ki', 'की',
+})
+_NAME_STOPWORDS = _TRAILING_FILLER | frozenset({
+    'mobile', 'phone', 'contact', 'address', 'adderss', 'from', 'se', 'i',
+    'call', 'live', 'living', 'at', 'in', 'मोबाइल', 'फोन', 'पता', 'से',
+})
+
+
+@dataclass(frozen=True)
+class ExtractedField:
+    value: str
+    confidence: float
+
+
+@dataclass(frozen=True)
+class ExtractionResult:
+    name: Optional[ExtractedField] = None
+    mobile: Optional[ExtractedField] = None
+    address: Optional[ExtractedField] = None
+
+    FIELDS = ('name', 'mobile', 'address')
+
+    def fields(self):
+        """Yield (field, ExtractedField) pairs for every field that was found"""
+        for field in self.FIELDS:
+            extracted = getattr(self, field)
+            if extracted is not None:
+                yield field, extracted
+
+    @property
+    def is_complete(self):
+        return all(getattr(self, field) is not None for field in self.FIELDS)
+
+
+def _clean_name(segment):
+    words = []
+    for raw in segment.split():
+        word = raw.strip(_PUNCT)
+        lowered = word.lower()
+        if not words and (not word or lowered in _LEADING_FILLER):
+            continue
+        if not word or lowered in _NAME_STOPWORDS or not _NAME_WORD.fullmatch(word):
+            break
+        words.append(word)
+        if len(words) == _MAX_NAME_WORDS or raw[-1] in ',;।':
+            break
+    return ' '.join(words)
+
+
+def _clean_address(segment):
+    sentence_end = _SENTENCE_END.search(segment)
+    if sentence_end:
+        segment = segment[:sentence_end.start()]
+    words = segment.split()
+    start, end = 0, len(words)
+    while start < end:
+        word = words[start].strip(_PUNCT).lower()
+        if word and word not in _LEADING_FILLER:
+            break
+        start += 1
+    while end > start:
+        word = words[end - 1].strip(_PUNCT).lower()
+        if word and word not in _TRAILING_FILLER:
+            break
+        end -= 1
+    return ' '.join(words[start:end]).strip(_PUNCT)
+
+
+def _keyword_confidence(text, markers, index, owner_group):
+    """
+    How far a name/address keyword can be trusted, or None to ignore it.
+
+    "my name", or a keyword opening a clause followed by "is"/":", is
+    trusted. A keyword opening a clause without them ("Name Rahul, ...")
+    is a low-confidence form field. Mid-sentence ("the name plate",
+    "road name is", "the address on my bill") is ordinary prose.
+    """
+    match = markers[index]
+    if match.group(owner_group):
+        return 0.9
+    opens_clause = _CLAUSE_BREAK.search(text, max(0, match.start() - 8), match.start())
+    if not opens_clause and index > 0:
+        # "... number 9876543210 address sector 5" follows another field's value
+        previous = markers[index - 1]
+        opens_clause = previous.lastgroup == 'number' and not text[previous.end():match.start()].strip()
+    if not opens_clause:
+        return None
+    if _COPULA.match(text, match.end()):
+        return 0.9
+    return _FORM_FIELD_CONFIDENCE
+
+
+def _looks_like_name(words):
+    """Positional names must be capitalised (or Devanagari), unlike prose"""
+    return all(not word[0].isascii() or word[0].isupper() for word in words.split())
+
+
+def extract_contact_info(text):
+    """
+    Extract name, Indian mobile number and address from a single message.
+
+    The message is scanned once with a combined precompiled pattern; every
+    keyword's value is the text up to the next keyword or phone number.
+    English, Hindi and Hinglish keywords are recognised, along with common
+    misspellings such as "adderss".
+
+    Args:
+        text (str): The user's message
+
+    Returns:
+        ExtractionResult: The fields found, each with a confidence in [0, 1]
+    """
+    if not text.isascii():
+        text = text.translate(_DEVANAGARI_DIGITS)
+
+    markers = list(_SCANNER.finditer(text))
+    name = mobile = address = None
+    number = None
+
+    for index, match in enumerate(markers):
+        kind = match.lastgroup
+        if kind == 'number':
+            if mobile is not None:
+                continue
+            previous = markers[index - 1] if index > 0 else None
+            keyed = (
+                previous is not None and previous.lastgroup == 'mobile_kw'
+                and _KEY_GAP.fullmatch(text, previous.end(), match.start())
+            )
+            if not keyed and _REFERENCE_CUE.search(text, max(0, match.start() - 30), match.start()):
+                continue
+            digits = match.group('digits').replace(' ', '').replace('-', '')
+            confidence = _KEYED_MOBILE_CONFIDENCE if keyed else _BARE_MOBILE_CONFIDENCE
+            mobile = ExtractedField(digits, confidence)
+            number = match
+            continue
+        if kind == 'mobile_kw':
+            continue
+
+        if (kind == 'name' and name is not None) or (kind == 'address' and address is not None):
+            continue
+        confidence = _keyword_confidence(text, markers, index, f'{kind}_owner')
+        if confidence is None:
+            continue
+        next_start = markers[index + 1].start() if index + 1 < len(markers) else len(text)
+        segment = text[match.end():next_start]
+        if kind == 'name':
+            value = _clean_name(segment)
+            if value:
+                name = ExtractedField(value, confidence)
+        else:
+            value = _clean_address(segment)
+            if len(value) >= _MIN_ADDRESS_LENGTH:
+                if confidence > _FORM_FIELD_CONFIDENCE and not any(ch.isdigit() for ch in value):
+                    confidence = 0.75
+                address = ExtractedField(value, confidence)
+
+    # Keyword-less "Rahul Sharma, 9876543210, 12 Main Street, Kanpur":
+    # name right before the number, address after it.
+    if number is not None and ',' in text and (name is None or address is None):
+        if name is None:
+            before = text[:number.start()].strip(_PUNCT)
+            value = _clean_name(before)
+            if value and value == before and _looks_like_name(value):
+                name = ExtractedField(value, _POSITIONAL_NAME_CONFIDENCE)
+        if address is None and number is markers[-1]:
+            value = _clean_address(text[number.end():])
+            if len(value) >= _MIN_ADDRESS_LENGTH:
+                address = ExtractedField(value, _POSITIONAL_ADDRESS_CONFIDENCE)
+
+    return ExtractionResult(name=name, mobile=mobile, address=address)
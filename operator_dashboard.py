@@ -0,0 +1,56 @@
+import pandas as pd
+import streamlit as st
+from complaint_db import ComplaintDatabase
+
+# Operator page; reads only the statistics rollups, never the complaints table.
+# Run separately from the chat app: streamlit run operator_dashboard.py
+
+st.set_page_config(
+    page_title="Complaint Operations Dashboard",
+    page_icon="📊",
+    layout="wide"
+)
+
+db = ComplaintDatabase()
+
+st.markdown("## 📊 Complaint Operations Dashboard")
+if st.button("Refresh"):
+    st.rerun()
+
+st.markdown("---")
+
+summary = db.get_stats_summary()
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Total complaints", summary['total'])
+col2.metric("Open backlog", summary['backlog'])
+col3.metric(
+    "Avg. time to resolve",
+    f"{summary['avg_resolution_hours']:.1f} h" if summary['avg_resolution_hours'] is not None else "—"
+)
+col4.metric(
+    "Escalations per session",
+    f"{summary['escalations_per_session']:.2f}" if summary['escalations_per_session'] is not None else "—",
+    help=f"{summary['escalations']} complaints registered by the chatbot over {summary['chat_sessions']} chat sessions"
+)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("### By status")
+    status_counts = db.get_status_counts()
+    if status_counts:
+        st.bar_chart(pd.Series(status_counts, name="Complaints"))
+    else:
+        st.info("No complaints yet.")
+
+with col2:
+    st.markdown("### Time to resolution")
+    histogram = db.get_resolution_histogram()
+    st.bar_chart(pd.DataFrame(histogram, columns=["Time to resolve", "Complaints"]).set_index("Time to resolve"))
+
+st.markdown("### Per day (last 30 days)")
+daily = db.get_daily_stats(days=30)
+if daily:
+    st.line_chart(pd.DataFrame(daily, columns=["Day", "Created", "Resolved"]).set_index("Day"))
+else:
+    st.info("No activity yet.")
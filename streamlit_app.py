@@ -1,3 +1,4 @@
+import uuid
 import streamlit as st
 from app import ComplaintResolutionChatbot
 
@@ -16,6 +17,10 @@ if 'chatbot' not in st.session_state:
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
 
+# Bumped after every answered turn so a late second click on the old form is ignored
+if 'form_id' not in st.session_state:
+    st.session_state.form_id = 0
+
 # Logo and header in one line
 col1, col2 = st.columns([1, 2])
 
@@ -35,11 +40,11 @@ st.markdown("---")
 # Input section
 st.markdown("### 💬 Send your message")
 
-with st.form(key="chat_form", clear_on_submit=True):
+with st.form(key=f"chat_form_{st.session_state.form_id}", clear_on_submit=True):
     user_input = st.text_area(
         label="",
         placeholder="Type your complaint, question, or 'check status COMP-XXXXXX'",
-        key="user_message",
+        key=f"user_message_{st.session_state.form_id}",
         label_visibility="collapsed",
         height=100
     )
@@ -52,9 +57,17 @@ with st.form(key="chat_form", clear_on_submit=True):
 if submitted and user_input.strip():
     with st.spinner("🤖 Support Assistant is typing..."):
         try:
-            reply = st.session_state.chatbot.get_response(user_input.strip())
-            st.session_state.chat_history.append({"role": "user", "content": user_input.strip()})
-            st.session_state.chat_history.append({"role": "bot", "content": reply})
+            # Idempotency key for this submission; reruns and double-clicks reuse it
+            if 'pending_turn_key' not in st.session_state:
+                st.session_state.pending_turn_key = str(uuid.uuid4())
+            turn_key = st.session_state.pending_turn_key
+            reply = st.session_state.chatbot.get_response(user_input.strip(), turn_key=turn_key)
+            if st.session_state.get('answered_turn_key') != turn_key:
+                st.session_state.chat_history.append({"role": "user", "content": user_input.strip()})
+                st.session_state.chat_history.append({"role": "bot", "content": reply})
+                st.session_state.answered_turn_key = turn_key
+            st.session_state.pop("pending_turn_key", None)
+            st.session_state.form_id += 1
             st.rerun()
         except Exception as e:
             st.error(f"❌ Something went wrong: {str(e)}")
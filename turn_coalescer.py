@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+
+# How long a finished turn can be replayed to a resubmission with the same key
+REPLAY_WINDOW_SECONDS = 60
+
+
+class _PendingTurn:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _CompletedTurn:
+    def __init__(self, result, expires_at):
+        self.result = result
+        self.expires_at = expires_at
+
+
+class TurnCoalescer:
+    """
+    Idempotent turn handling keyed by (session, turn key).
+
+    The UI generates a turn key per form submission and reuses it when a
+    double-click or network retry resubmits the same turn. Calls with a
+    key that is still running wait for it and share its result; a finished
+    key is replayed for a short window. A deliberate repeat of the same
+    text gets a new key and runs normally. Failed turns are not kept, so a
+    retry after an error runs again.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(TurnCoalescer, cls).__new__(cls)
+                cls._instance.initialized = False
+            return cls._instance
+
+    def __init__(self):
+        if self.initialized:
+            return
+
+        with self._lock:
+            if not self.initialized:
+                self.replay_window = REPLAY_WINDOW_SECONDS
+                self._in_flight = {}
+                self._completed = OrderedDict()  # (session_id, turn_key) -> _CompletedTurn, oldest first
+                self.initialized = True
+
+    def _expire(self, now):
+        while self._completed:
+            key, turn = next(iter(self._completed.items()))
+            if turn.expires_at > now:
+                break
+            del self._completed[key]
+
+    def run(self, session_id, turn_key, func):
+        """
+        Run func() once for this (session, turn key) and return its result.
+
+        Args:
+            session_id (str): Identifies the chat session
+            turn_key (str): Idempotency key of this submission
+            func (callable): Produces the turn's result; called at most once
+                per key while the key is in flight or replayable
+
+        Returns:
+            tuple: (result, replayed) where replayed is True when the result
+                came from an earlier or concurrent call with the same key
+        """
+        key = (session_id, turn_key)
+        with self._lock:
+            self._expire(time.monotonic())
+            completed = self._completed.get(key)
+            if completed is not None:
+                return completed.result, True
+
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = _PendingTurn()
+
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result, True
+
+        try:
+            pending.result = func()
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if pending.error is None:
+                    self._completed[key] = _CompletedTurn(
+                        pending.result, time.monotonic() + self.replay_window
+                    )
+            pending.done.set()
+        return pending.result, False
+
+    def forget(self, session_id):
+        """Drop the replayable turns of a session, e.g. when its chat is cleared"""
+        with self._lock:
+            for key in [key for key in self._completed if key[0] == session_id]:
+                del self._completed[key]